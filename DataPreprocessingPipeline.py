@@ -4,49 +4,120 @@
 # A data preparation pipeline is an automated, methodical process that integrates several preprocessing stages into a seamless workflow. 
 # For data professionals, it acts as a road map, assisting them with the conversions and computations required to clean up and get ready data for analysis.
 
+import threading
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler
-from sklearn.impute import KNNImputer
+from sklearn.impute import KNNImputer, SimpleImputer
 
-def data_preprocessing_pipeline(data):
+#Numba is optional; without it outliers are replaced with plain NumPy.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+#KNN imputation builds an n x n distance matrix, so larger datasets fall back to the column median.
+KNN_MAX_ROWS = 5000
+
+#The median imputer is created once per thread and reused by later calls; fit_transform refits it every time,
+#so it only needs to be private to the thread that uses it. KNNImputer is not cached because it keeps a copy of
+#the last dataset it was fitted on.
+_imputers = threading.local()
+
+#Numeric features are processed as float32 by default, which halves the memory traffic of every numeric step.
+#Pass dtype=np.float64 when full double precision is needed.
+#outlier_strategy='mean' replaces outliers with the column mean; 'clip' caps them at the IQR bounds instead.
+def data_preprocessing_pipeline(data, dtype=np.float32, outlier_strategy='mean'):
+    if outlier_strategy not in ('mean', 'clip'):
+        raise ValueError(f"outlier_strategy must be 'mean' or 'clip', got {outlier_strategy!r}")
 
     #Identify numeric and categorical features
     numeric_features = data.select_dtypes(include=['float', 'int']).columns
     categorical_features = data.select_dtypes(include=['object']).columns
 
-    #Handle missing values in numeric features using the KNN technique
-    data[numeric_features] = handle_missing_values(data[numeric_features])
-
     #Handle missing values in categorical features using mode value.
-    data[categorical_features] = data[categorical_features].fillna(data[categorical_features].mode().iloc[0])
+    #Columns with no values at all are left as they are.
+    mode_values = {}
+    for feature in categorical_features:
+        counts = data[feature].value_counts()
+        if not counts.empty:
+            mode_values[feature] = counts.idxmax()
+    data.fillna(mode_values, inplace=True)
 
     #Alternative; missing values in categorical features replaced with value "unknown".
     #data[categorical_features] = data[categorical_features].fillna('Unknown')
 
+    #The numeric steps below all work on one array, which is written back to the DataFrame once at the end
+    #instead of building a new DataFrame after every step.
+    arr = data[numeric_features].to_numpy(dtype=dtype)
+
+    #Handle missing values in numeric features using the KNN technique
+    arr = get_imputer(len(arr)).fit_transform(arr).astype(dtype, copy=False)
+
     #Detect and handle outliers in numeric features using IQR
-    for feature in numeric_features:
-        Q1 = data[feature].quantile(0.25)
-        Q3 = data[feature].quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - (1.5 * IQR)
-        upper_bound = Q3 + (1.5 * IQR)
-        data[feature] = np.where((data[feature] < lower_bound) | (data[feature] > upper_bound),
-                                data[feature].mean(), data[feature])
+    #arr has no missing values after imputation, so the vectorised np.quantile can be used for every column at once.
+    Q1, Q3 = np.quantile(arr, [0.25, 0.75], axis=0)
+    IQR = Q3 - Q1
+    lower_bound = Q1 - (1.5 * IQR)
+    upper_bound = Q3 + (1.5 * IQR)
+    if outlier_strategy == 'clip':
+        np.clip(arr, lower_bound, upper_bound, out=arr)
+    else:
+        means = arr.mean(axis=0, dtype=np.float64)
+        replace_outliers_with_mean(arr, lower_bound, upper_bound, means)
 
     # Normalize numeric features 
     #Using Standardization (Z-score Normalization) method; (Transforms features to have a mean of 0 and a standard deviation of 1.)
-    scaler = StandardScaler()
-    data[numeric_features] = scaler.fit_transform(data[numeric_features])  
+    #Computed directly on arr in place; constant columns keep a scale of 1, as with StandardScaler.
+    #Rounding leaves constant columns with a tiny non-zero variance, so they are detected with the same
+    #tolerance as scikit-learn's _is_constant_feature.
+    #The statistics are accumulated in float64 even when arr is float32; float32 sums lose the spread of columns
+    #whose mean is large compared to their standard deviation.
+    mean = arr.mean(axis=0, dtype=np.float64)
+    var = arr.var(axis=0, dtype=np.float64)
+    eps = np.finfo(var.dtype).eps
+    n_rows = len(arr)
+    constant = var <= n_rows * eps * var + (n_rows * mean * eps) ** 2
+    std = np.sqrt(var)
+    std[constant] = 1
+    arr -= mean
+    arr /= std
+
+    data[numeric_features] = arr
 
     return data
 
 #Use KNN Imputer to impute missing values based on the values of other features.
+#Datasets with KNN_MAX_ROWS rows or more are imputed with the median of each column instead.
+def get_imputer(n_rows):
+    if n_rows < KNN_MAX_ROWS:
+        return KNNImputer()
+    if not hasattr(_imputers, 'median'):
+        _imputers.median = SimpleImputer(strategy='median')
+    return _imputers.median
+
 def handle_missing_values(data):
-    imputer = KNNImputer()
-    data_imputed = pd.DataFrame(imputer.fit_transform(data), columns=data.columns)
+    imputer = get_imputer(len(data))
+    data_imputed = pd.DataFrame(imputer.fit_transform(data), columns=data.columns, index=data.index)
     return data_imputed
 
+#Replace the values of arr outside [lower_bound, upper_bound] with the column mean, in place.
+def replace_outliers_with_mean_numpy(arr, lower_bound, upper_bound, means):
+    outliers = (arr < lower_bound) | (arr > upper_bound)
+    np.copyto(arr, np.broadcast_to(means, arr.shape), where=outliers)
+
+if njit is not None:
+    #Compiled loop: compares and replaces in a single pass without building a mask, columns split across threads.
+    #arr comes from to_numpy() and the imputers in column-major order, so each column is contiguous.
+    @njit(parallel=True, cache=True)
+    def replace_outliers_with_mean(arr, lower_bound, upper_bound, means):
+        for j in prange(arr.shape[1]):
+            for i in range(arr.shape[0]):
+                value = arr[i, j]
+                if value < lower_bound[j] or value > upper_bound[j]:
+                    arr[i, j] = means[j]
+else:
+    replace_outliers_with_mean = replace_outliers_with_mean_numpy
+
 #use IQR to handle outliers
 def handle_outliers_iqr(data, threshold=1.5):
     Q1 = data.quantile(0.25)
@@ -59,12 +130,14 @@ def handle_outliers_iqr(data, threshold=1.5):
     return data[~((data < lower_bound) | (data > upper_bound)).any(axis=1)]
 
 #Test the pipeline
-data = pd.read_csv("data.csv")
+#Only runs when executed as a script, so importing the pipeline does not read data.csv.
+if __name__ == "__main__":
+    data = pd.read_csv("data.csv")
 
-print("Original Data:")
-print(data)
+    print("Original Data:")
+    print(data)
 
-cleaned_data = data_preprocessing_pipeline(data) 
+    cleaned_data = data_preprocessing_pipeline(data) 
 
-print("Preprocessed Data:")
-print(cleaned_data)
+    print("Preprocessed Data:")
+    print(cleaned_data)
@@ -1,5 +1,6 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.wsgi import WSGIMiddleware
 import dash
 from dash import dcc, html, dash_table
@@ -66,7 +67,7 @@ def update_output(contents, filename):
     content_type, content_string = contents.split(',')
     decoded = base64.b64decode(content_string)
     try:
-        df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+        df = pd.read_csv(io.BytesIO(decoded))
     except Exception as e:
         return html.Div(f"Error processing file: {str(e)}"), None, None, None, False
 
@@ -85,8 +86,11 @@ def update_output(contents, filename):
         data_table
     ])
 
+    # Count missing values once; the counts are reused by the graph
+    missing_counts = df.isnull().sum()
+
     # Check if the DataFrame is empty or has no missing values
-    if df.empty or df.isnull().sum().sum() == 0:
+    if df.empty or missing_counts.sum() == 0:
         graph = html.Div("No missing values found in the uploaded file.",
                          style={'textAlign': 'center',
                                 'fontWeight': 'bold',
@@ -95,7 +99,7 @@ def update_output(contents, filename):
     else:
         # Generate the graph for missing values
         graph = dcc.Graph(
-            figure=processManager.create_missing_values_graph(df)
+            figure=processManager.create_missing_values_graph(df, missing_counts)
         )
 
     # Filter numerical columns
@@ -110,7 +114,7 @@ def update_output(contents, filename):
                                         'marginBottom': '10px'})
     else:
         # Create the summary table for numerical columns
-        summary_df = processManager.create_summary_dataframe(numerical_df)
+        summary_df = processManager.create_summary_dataframe(numerical_df, missing_counts)
         summary_table_content = processManager.generate_data_table(summary_df)
 
         # Add the title for the summary table
@@ -152,7 +156,7 @@ def download_excel(n_clicks, contents, filename):
     if n_clicks > 0 and contents is not None:
         content_type, content_string = contents.split(',')
         decoded = base64.b64decode(content_string)
-        df = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+        df = pd.read_csv(io.BytesIO(decoded))
 
         # Create a BytesIO object to store the Excel file
         excel_file = io.BytesIO()
@@ -187,17 +191,12 @@ async def csv_to_excel_with_description(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="Only CSV files are allowed")
 
     try:
-        contents = await file.read()
-        df = pd.read_csv(io.StringIO(contents.decode('utf-8')))
-
         # Create a BytesIO object to store the Excel file
         excel_file = io.BytesIO()
 
-        # Write the DataFrame and its description to the Excel file
-        with pd.ExcelWriter(excel_file, engine='xlsxwriter') as writer:
-            processManager.create_data_sheet(df, writer)
-            processManager.create_summary_sheet(df, writer)
-            processManager.create_missing_values_graph_excel(df, writer)
+        # Parse the upload straight from its spooled temporary file and write the data and its description
+        # to the Excel file. This blocks, so it runs in a worker thread instead of the event loop.
+        await run_in_threadpool(processManager.create_excel_from_csv, file.file, excel_file)
 
         # Seek to the beginning of the BytesIO object
         excel_file.seek(0)
@@ -2,11 +2,33 @@
 import io
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
-from typing import Dict
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from dash import dash_table
 import plotly.graph_objs as go
 
+# Number of CSV rows parsed at a time when an upload is processed in chunks
+CSV_CHUNK_SIZE = 100_000
+
+# Same look as the header cells pandas writes with to_excel
+HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+def excel_rows(df: pd.DataFrame, index: bool = False) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield the rows of a DataFrame as tuples for worksheet.write_row, with missing values as None (blank cells)
+    and infinite values as the 'inf'/'-inf' text that to_excel writes for them.
+    """
+    values = df.to_numpy(dtype=object)
+    values[pd.isna(values)] = None
+    values[values == np.inf] = 'inf'
+    values[values == -np.inf] = '-inf'
+    rows = map(tuple, values)
+    if index:
+        return ((label, *row) for label, row in zip(df.index, rows))
+    return rows
+
 def create_data_sheet(df: pd.DataFrame, writer: pd.ExcelWriter) -> None:
     """
     Create the 'Data' sheet with the full dataset and adjust column widths.
@@ -26,9 +48,19 @@ def create_summary_sheet(df: pd.DataFrame, writer: pd.ExcelWriter) -> None:
     """
     Create the 'Summary' sheet with descriptive statistics and adjust column widths.
     """
-    summary_df = df.describe().T
-    summary_df.to_excel(writer, sheet_name='Summary')
-    worksheet = writer.sheets['Summary']
+    write_summary_sheet(df.describe().T, writer)
+
+def write_summary_sheet(summary_df: pd.DataFrame, writer: pd.ExcelWriter) -> None:
+    """
+    Write precomputed descriptive statistics to the 'Summary' sheet and adjust column widths.
+    Cells are written row by row, so this also works for writers in constant_memory mode.
+    """
+    worksheet = writer.book.add_worksheet('Summary')
+    header_format = writer.book.add_format(HEADER_FORMAT)
+    worksheet.write_row(0, 1, [str(col) for col in summary_df.columns], header_format)
+    for row, (label, *values) in enumerate(excel_rows(summary_df, index=True), start=1):
+        worksheet.write(row, 0, label, header_format)
+        worksheet.write_row(row, 1, values)
     
     for i, col in enumerate(summary_df.columns):
         max_len = max(
@@ -37,10 +69,147 @@ def create_summary_sheet(df: pd.DataFrame, writer: pd.ExcelWriter) -> None:
         )
         worksheet.set_column(i, i, max_len + 2)  # Add a little extra space
 
+def find_column_types(chunks: Iterable[pd.DataFrame]) -> Tuple[List[str], pd.DataFrame]:
+    """
+    Return the text columns of a CSV read in chunks, and the columns that are numerical in every chunk
+    concatenated over all chunks.
+    Each chunk infers its own column types. A column is text when it holds text in any chunk, or when it is boolean
+    in some chunks and numerical in others; reading the whole file in one go would give it the object type.
+    A column that is empty in a chunk is typed null there; it is read as float, like an empty column of a whole file.
+    """
+    column_kinds: Dict[str, set] = {}
+    numerical_chunks = []
+    for chunk in chunks:
+        for col, dtype in chunk.dtypes.items():
+            kinds = column_kinds.setdefault(col, set())
+            if dtype == pd.ArrowDtype(pa.null()):
+                continue
+            elif pd.api.types.is_bool_dtype(dtype):
+                kinds.add('bool')
+            elif pd.api.types.is_numeric_dtype(dtype):
+                kinds.add('number')
+            else:
+                kinds.add('text')
+        empty_columns = {col: 'float64' for col, dtype in chunk.dtypes.items() if dtype == pd.ArrowDtype(pa.null())}
+        numerical_chunk = chunk.astype(empty_columns).select_dtypes(include=['number'])
+        # describe() reports floats anyway, and one common type keeps the concatenation free of dtype guessing.
+        # NumPy float64 rounds integers beyond 2**53 like describe() does, where Arrow's safe cast would reject them.
+        numerical_chunks.append(numerical_chunk.astype('float64'))
+    text_columns = [col for col, kinds in column_kinds.items() if 'text' in kinds or len(kinds) > 1]
+    return text_columns, pd.concat(numerical_chunks, join='inner', ignore_index=True)
+
+def create_text_summary(value_counts: Dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Build the same statistics as df.describe().T for non-numerical columns from their accumulated value counts.
+    """
+    summary = {}
+    for col, counts in value_counts.items():
+        counts = counts[counts > 0]
+        summary[col] = {
+            'count': counts.sum(),
+            'unique': len(counts),
+            'top': counts.idxmax() if len(counts) else np.nan,
+            'freq': counts.max() if len(counts) else np.nan,
+        }
+    return pd.DataFrame.from_dict(summary, orient='index', columns=['count', 'unique', 'top', 'freq'], dtype=object)
+
+def create_sheets_from_chunks(chunks: Iterable[pd.DataFrame], writer: pd.ExcelWriter, numerical_df: pd.DataFrame) -> None:
+    """
+    Create the 'Data', 'Summary' and 'Missing Values' sheets from a CSV read in chunks.
+    numerical_df holds the numerical columns of the whole CSV (see find_column_types) and is used for the summary.
+    The data rows are written in order, so the writer can use xlsxwriter's constant_memory mode.
+    """
+    worksheet = None
+    rows_written = 0
+    col_widths: Dict[str, int] = {}
+    missing_values = None
+    # Like describe(), non-numerical columns are only summarised when there are no numerical columns
+    describe_text = numerical_df.columns.empty
+    value_counts: Dict[str, pd.Series] = {}
+
+    for chunk in chunks:
+        # Write the header with the first chunk and append the rows of every chunk below it
+        if worksheet is None:
+            worksheet = writer.book.add_worksheet('Data')
+            worksheet.write_row(0, 0, [str(col) for col in chunk.columns], writer.book.add_format(HEADER_FORMAT))
+        for values in excel_rows(chunk):
+            rows_written += 1
+            worksheet.write_row(rows_written, 0, values)
+
+        for col in chunk.columns:
+            max_len = max(
+                chunk[col].astype(str).map(len).max(),  # max length of column data
+                len(str(col))  # length of column name
+            )
+            col_widths[col] = max(col_widths.get(col, 0), max_len)
+
+        # Same blank-string handling as create_missing_values_graph_excel
+        chunk_missing = chunk.replace(r'^\s*$', pd.NA, regex=True).isnull().sum()
+        missing_values = chunk_missing if missing_values is None else missing_values + chunk_missing
+
+        if describe_text:
+            for col in chunk.columns:
+                counts = chunk[col].value_counts(sort=False)
+                if col in value_counts:
+                    # Keep the values in order of first appearance
+                    counts = pd.concat([value_counts[col], counts]).groupby(level=0, sort=False).sum()
+                value_counts[col] = counts
+
+    if worksheet is None:
+        return
+
+    for i, col in enumerate(col_widths):
+        worksheet.set_column(i, i, col_widths[col] + 2)  # Add a little extra space
+
+    if describe_text:
+        write_summary_sheet(create_text_summary(value_counts), writer)
+    else:
+        write_summary_sheet(numerical_df.describe().T, writer)
+
+    write_missing_values_graph_excel(missing_values, writer)
+
+def create_excel_from_csv(csv_file: IO[bytes], excel_file: IO[bytes]) -> None:
+    """
+    Read a CSV file in chunks and write its 'Data', 'Summary' and 'Missing Values' sheets to an Excel file.
+    The file is read twice: once to find the column types of the whole file, then to write the sheets.
+    """
+    # Columns are stored as Arrow arrays, so text columns are not held as Python string objects.
+    # Quartiles need every value of a column, so the numerical columns are kept for the summary.
+    with pd.read_csv(csv_file, chunksize=CSV_CHUNK_SIZE, dtype_backend='pyarrow') as chunks:
+        text_columns, numerical_df = find_column_types(chunks)
+    csv_file.seek(0)
+
+    # Text columns are read as text in every chunk, as they would be when the file is read in one go
+    text_dtypes = {col: pd.ArrowDtype(pa.string()) for col in text_columns}
+
+    # In constant_memory mode xlsxwriter flushes each row once the next one starts, so memory use
+    # does not grow with the number of rows in the 'Data' sheet.
+    with pd.read_csv(csv_file, chunksize=CSV_CHUNK_SIZE, dtype_backend='pyarrow', dtype=text_dtypes) as chunks, \
+            pd.ExcelWriter(excel_file, engine='xlsxwriter',
+                           engine_kwargs={'options': {'constant_memory': True}}) as writer:
+        create_sheets_from_chunks(chunks, writer, numerical_df)
+
 # Function to create the summary DataFrame'
 #UI
-def create_summary_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    summary_df = df.describe().T
+def create_summary_dataframe(df: pd.DataFrame, missing_counts: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    Build the same statistics as df.describe().T for numerical columns.
+    Each statistic is reduced over the whole DataFrame at once instead of column by column,
+    and the counts are taken from missing_counts when the caller has already computed df.isnull().sum().
+    """
+    if missing_counts is None:
+        missing_counts = df.isnull().sum()
+    quartiles = df.quantile([0.25, 0.5, 0.75])
+    summary_df = pd.DataFrame({
+        'count': len(df) - missing_counts[df.columns],
+        'mean': df.mean(),
+        'std': df.std(),
+        'min': df.min(),
+        '25%': quartiles.loc[0.25],
+        '50%': quartiles.loc[0.5],
+        '75%': quartiles.loc[0.75],
+        'max': df.max(),
+    }).astype(float)  # describe() reports every statistic as float, including counts and integer min/max
     summary_df.reset_index(inplace=True)
     summary_df.rename(columns={'index': 'Metric'}, inplace=True)
     return summary_df
@@ -60,11 +229,13 @@ def generate_data_table(df: pd.DataFrame) -> dash_table.DataTable:
     )
 
 # Function to generate the missing values graph
-def create_missing_values_graph(df: pd.DataFrame) -> go.Figure:
+def create_missing_values_graph(df: pd.DataFrame, missing_counts: Optional[pd.Series] = None) -> go.Figure:
     """
     Generate a Plotly bar graph showing the count of missing values for each column.
+    Pass missing_counts when the caller has already computed df.isnull().sum().
     """
-    missing_counts = df.isnull().sum()
+    if missing_counts is None:
+        missing_counts = df.isnull().sum()
 
     # Create a bar chart using Plotly
     fig = go.Figure(data=[
@@ -93,9 +264,13 @@ def create_missing_values_graph_excel(df: pd.DataFrame, writer: pd.ExcelWriter)
     """
     Create a 'Missing Values' sheet with a bar graph of missing values in an Excel file.
     """
-    # Your existing code for creating a graph and inserting it into an Excel sheet
     df = df.replace(r'^\s*$', pd.NA, regex=True)
-    missing_values = df.isnull().sum()
+    write_missing_values_graph_excel(df.isnull().sum(), writer)
+
+def write_missing_values_graph_excel(missing_values: pd.Series, writer: pd.ExcelWriter) -> None:
+    """
+    Create a 'Missing Values' sheet with a bar graph of precomputed missing value counts per column.
+    """
     columns = [col for col, count in zip(missing_values.index, missing_values) if count > 0]
     counts = [count for count in missing_values if count > 0]
 
@@ -0,0 +1,124 @@
+import io
+
+import openpyxl
+import pandas as pd
+import pytest
+
+import processManager
+
+
+def csv_to_excel(csv: str) -> io.BytesIO:
+    excel_file = io.BytesIO()
+    processManager.create_excel_from_csv(io.BytesIO(csv.encode()), excel_file)
+    excel_file.seek(0)
+    return excel_file
+
+
+def read_summary(excel_file: io.BytesIO) -> pd.DataFrame:
+    excel_file.seek(0)
+    return pd.read_excel(excel_file, sheet_name='Summary', index_col=0)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Small chunks so that the test files are split over several of them
+    monkeypatch.setattr(processManager, 'CSV_CHUNK_SIZE', 3)
+
+
+@pytest.mark.parametrize('csv', [
+    "x,y\na,b\nc,\na,d\ne,f\n",
+    "x,y\n",
+])
+def test_summary_of_text_only_csv_matches_describe(csv):
+    summary = read_summary(csv_to_excel(csv))
+    expected = pd.read_csv(io.StringIO(csv)).describe().T
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False, check_names=False)
+
+
+def test_column_with_text_in_a_later_chunk_is_written_as_text():
+    csv = "a,b\n1,1\n2,2\n3,3\n4,4\n5,oops\n"
+    excel_file = csv_to_excel(csv)
+
+    data_sheet = openpyxl.load_workbook(excel_file)['Data']
+    assert [row[1] for row in data_sheet.iter_rows(min_row=2, values_only=True)] == ['1', '2', '3', '4', 'oops']
+
+    summary = read_summary(excel_file)
+    expected = pd.read_csv(io.StringIO(csv)).describe().T
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False, check_names=False)
+
+
+@pytest.mark.parametrize('csv', [
+    "a,c\n1,1\n2,2\n3,3\n,4\n,5\n,6\n7,7\n",
+    "a,c\n,1\n,2\n,3\n,4\n",
+])
+def test_column_empty_in_a_chunk_stays_in_the_summary(csv):
+    summary = read_summary(csv_to_excel(csv))
+    expected = pd.read_csv(io.StringIO(csv)).describe().T
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False, check_names=False)
+
+
+def test_infinite_values_are_written_as_text():
+    csv = "a,b\n1,x\ninf,y\n-inf,z\n2,w\n"
+    workbook = openpyxl.load_workbook(csv_to_excel(csv))
+
+    assert [row[0] for row in workbook['Data'].iter_rows(min_row=2, values_only=True)] == [1, 'inf', '-inf', 2]
+    assert 'inf' in [cell for row in workbook['Summary'].iter_rows(values_only=True) for cell in row]
+
+
+def test_download_sheets_with_infinite_values():
+    # Same sheets as the Dash download callback
+    df = pd.DataFrame({'a': [1.0, float('inf'), float('-inf'), 2.0]})
+    excel_file = io.BytesIO()
+    with pd.ExcelWriter(excel_file, engine='xlsxwriter') as writer:
+        processManager.create_data_sheet(df, writer)
+        processManager.create_summary_sheet(df, writer)
+        processManager.create_missing_values_graph_excel(df, writer)
+
+    summary = openpyxl.load_workbook(excel_file)['Summary']
+    cells = {header: value for header, value in zip(*summary.iter_rows(values_only=True))}
+    assert cells['min'] == '-inf'
+    assert cells['max'] == 'inf'
+
+
+def test_boolean_columns_keep_their_type():
+    csv = "a,b\nTrue,1\nFalse,2\nTrue,3\nFalse,4\nTrue,5\n"
+    excel_file = csv_to_excel(csv)
+
+    data_sheet = openpyxl.load_workbook(excel_file)['Data']
+    assert [row[0] for row in data_sheet.iter_rows(min_row=2, values_only=True)] == [True, False, True, False, True]
+
+    summary = read_summary(excel_file)
+    expected = pd.read_csv(io.StringIO(csv)).describe().T
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False, check_names=False)
+
+
+def test_summary_of_boolean_only_csv_matches_describe():
+    csv = "a\nTrue\nFalse\nTrue\nTrue\n"
+    excel_file = csv_to_excel(csv)
+
+    summary = openpyxl.load_workbook(excel_file)['Summary']
+    cells = {header: value for header, value in zip(*summary.iter_rows(values_only=True))}
+    expected = pd.read_csv(io.StringIO(csv)).describe()['a']
+    assert cells == {None: 'a', 'count': expected['count'], 'unique': expected['unique'],
+                     'top': expected['top'], 'freq': expected['freq']}
+    assert cells['top'] is True
+
+
+def test_summary_of_integers_beyond_float_precision():
+    csv = "id,v\n1234567890123456789,1\n2,2\n9223372036854775807,3\n4,4\n"
+    summary = read_summary(csv_to_excel(csv))
+    expected = pd.read_csv(io.StringIO(csv)).describe().T
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False, check_names=False)
+
+
+@pytest.mark.parametrize('df', [
+    pd.DataFrame({'ints': [1, 2, 3, 4, 5], 'more_ints': [10, 20, 30, 40, 50]}),
+    pd.DataFrame({
+        'ints': [1, 2, 3, 4, 5],
+        'floats': [0.5, 1.5, 2.5, 3.5, 100.0],
+        'with_nan': [1.0, None, 3.0, None, 5.0],
+    }),
+])
+def test_summary_dataframe_matches_describe(df):
+    expected = df.describe().T.reset_index().rename(columns={'index': 'Metric'})
+    pd.testing.assert_frame_equal(processManager.create_summary_dataframe(df), expected)
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataPreprocessingPipeline import data_preprocessing_pipeline
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_constant_column_is_standardised_to_zero(dtype):
+    data = pd.DataFrame({'constant': [0.1] * 50, 'other': np.arange(50.0)})
+
+    cleaned_data = data_preprocessing_pipeline(data, dtype=dtype)
+
+    np.testing.assert_allclose(cleaned_data['constant'], 0, atol=1e-6)
+
+
+@pytest.mark.parametrize('center, spread', [(40.7, 0.05), (10000.0, 1.0)])
+def test_float32_standardisation_matches_float64(center, spread):
+    # A large mean with a small spread is where float32 accumulation loses precision
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({'feature': rng.uniform(center - spread, center + spread, 200_000)})
+
+    cleaned_float32 = data_preprocessing_pipeline(data.copy(), dtype=np.float32)
+    cleaned_float64 = data_preprocessing_pipeline(data.copy(), dtype=np.float64)
+
+    assert abs(cleaned_float32['feature'].mean()) < 1e-3
+    assert cleaned_float32['feature'].std(ddof=0) == pytest.approx(1, abs=1e-3)
+    np.testing.assert_allclose(cleaned_float32['feature'], cleaned_float64['feature'], atol=1e-2)
+
+
+@pytest.mark.parametrize('order', ['C', 'F'])
+def test_numba_outlier_kernel_matches_numpy(order):
+    pytest.importorskip('numba')
+    import DataPreprocessingPipeline as pipeline
+
+    rng = np.random.default_rng(0)
+    arr = np.asarray(rng.normal(size=(1000, 4)), dtype=np.float32, order=order)
+    lower_bound = np.array([-1.0, -2.0, -0.5, -3.0])
+    upper_bound = np.array([1.0, 2.0, 0.5, 3.0])
+    means = np.array([0.1, 0.2, 0.3, 0.4])
+
+    expected = arr.copy(order=order)
+    pipeline.replace_outliers_with_mean_numpy(expected, lower_bound, upper_bound, means)
+    pipeline.replace_outliers_with_mean(arr, lower_bound, upper_bound, means)
+
+    np.testing.assert_array_equal(arr, expected)
+
+
+def standardise(values):
+    values = np.asarray(values, dtype=np.float64)
+    return (values - values.mean()) / values.std()
+
+
+@pytest.mark.parametrize('outlier_strategy, handled_values', [
+    # Q1 = 2 and Q3 = 4, so the IQR bounds are -1 and 7
+    ('mean', [1, 2, 3, 4, 22]),
+    ('clip', [1, 2, 3, 4, 7]),
+])
+def test_outlier_strategy(outlier_strategy, handled_values):
+    data = pd.DataFrame({'feature': [1.0, 2.0, 3.0, 4.0, 100.0]})
+
+    cleaned_data = data_preprocessing_pipeline(data, dtype=np.float64, outlier_strategy=outlier_strategy)
+
+    np.testing.assert_allclose(cleaned_data['feature'], standardise(handled_values))
+
+
+def test_unknown_outlier_strategy_is_rejected():
+    data = pd.DataFrame({'feature': [1.0, 2.0, 3.0]})
+
+    with pytest.raises(ValueError, match='outlier_strategy'):
+        data_preprocessing_pipeline(data, outlier_strategy='drop')